@@ -4,18 +4,44 @@ Provides a clean UI for interacting with the RAG pipeline.
 """
 
 import streamlit as st
+import logging
 import os
-from typing import Dict, List, Any
+import hashlib
+from typing import Dict, List, Any, Tuple, TYPE_CHECKING
 import time
+import diskcache
 from dotenv import load_dotenv
 
 # Import our custom modules
-from data_loader import SuperLigDataLoader, create_document_store
+from data_loader import (
+    CACHE_DIR,
+    EMBEDDING_MODEL,
+    SuperLigDataLoader,
+    create_document_store,
+    document_store_key,
+    preprocessing_key,
+)
 from rag_pipeline import RAGPipelineManager
 
+if TYPE_CHECKING:
+    from haystack import Document
+
 # Load environment variables
 load_dotenv()
 
+# Status messages of the pipeline modules go to stderr at LOG_LEVEL
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
+# Generated answers are cached on disk for one day
+ANSWER_CACHE_DIR = os.path.join(CACHE_DIR, "answers")
+ANSWER_CACHE_TTL = 24 * 60 * 60
+
+# Minimum seconds between re-renders of a streamed answer
+STREAM_RENDER_INTERVAL = 0.05
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="Türkçe RAG Chatbot",
@@ -66,48 +92,243 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+class _SampleDataFallback(Exception):
+    """Raised by prepare_document_records when the loader fell back to sample data."""
+    
+    def __init__(self, records: List[Dict[str, Any]]):
+        """
+        Initialize the exception.
+        
+        Args:
+            records: Prepared records of the sample data
+        """
+        super().__init__("Dataset could not be loaded; using sample data")
+        self.records = records
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def prepare_document_records(dataset_name: str, revision: str, settings: str) -> List[Dict[str, Any]]:
+    """
+    Load, preprocess and chunk a dataset revision.
+    
+    The result only depends on the dataset revision and the preprocessing
+    settings, so it is cached on disk and later starts skip preprocessing
+    and chunking. Streamlit only hashes this function's own source, so the
+    settings are passed in to key the cache. Plain dicts are returned
+    because the cache pickles its values.
+    
+    Args:
+        dataset_name: Name of the dataset on the Hugging Face Hub
+        revision: Commit SHA of the dataset
+        settings: Preprocessing settings from preprocessing_key
+        
+    Returns:
+        List of {'content': ..., 'meta': ...} dictionaries
+        
+    Raises:
+        _SampleDataFallback: If the dataset could not be loaded; exceptions
+            are not cached, so sample data never ends up under a real revision
+    """
+    loader = SuperLigDataLoader(dataset_name)
+    documents = loader.load_and_prepare_data()
+    records = [{'content': doc.content, 'meta': doc.meta} for doc in documents]
+    if loader.using_sample_data:
+        raise _SampleDataFallback(records)
+    return records
+
+
+def load_documents() -> List['Document']:
+    """
+    Load the prepared dataset documents.
+    
+    Returns:
+        List of prepared Document objects
+    """
+    from haystack import Document
+    
+    loader = SuperLigDataLoader()
+    revision = loader.get_dataset_revision()
+    
+    # Without a revision the cache could serve stale or fallback data
+    if not revision:
+        return loader.load_and_prepare_data()
+    
+    try:
+        records = prepare_document_records(loader.dataset_name, revision, preprocessing_key())
+    except _SampleDataFallback as e:
+        records = e.records
+    return [Document(content=record['content'], meta=record['meta']) for record in records]
+
+
+@st.cache_resource(show_spinner="RAG sistemi yükleniyor...")
+def initialize_rag_system(api_key: str, model_name: str = EMBEDDING_MODEL) -> Tuple[RAGPipelineManager, str]:
+    """
+    Initialize the RAG system once per process.
+    
+    The manager (embedders, document store and Gemini client) is shared by
+    all sessions. The resource cache is keyed by the embedding model, which
+    together with the documents also keys the on-disk embedding cache.
+    Exceptions are not cached, so a failed initialization is retried.
+    
+    Args:
+        api_key: Google API key
+        model_name: Name of the embedding model
+    
+    Returns:
+        Tuple of RAGPipelineManager instance and document store hash
+    """
+    # Load data
+    documents = load_documents()
+    
+    # Create document store
+    doc_store = create_document_store(documents, model=model_name)
+    
+    # Initialize RAG pipeline and load the query embedder up front
+    rag_manager = RAGPipelineManager(doc_store, api_key)
+    rag_manager.warm_up()
+    return rag_manager, document_store_key(documents, model_name)
+
+
 @st.cache_resource
-def initialize_rag_system():
+def get_answer_cache() -> diskcache.Cache:
     """
-    Initialize the RAG system with caching.
+    Open the disk-backed answer cache shared by all sessions.
     
     Returns:
-        RAGPipelineManager instance
+        diskcache.Cache instance
     """
-    with st.spinner("RAG sistemi yükleniyor..."):
-        try:
-            # Load data
-            loader = SuperLigDataLoader()
-            documents = loader.load_and_prepare_data()
-            
-            # Create document store
-            doc_store = create_document_store(documents)
-            
-            # Initialize RAG pipeline
-            api_key = os.getenv("GOOGLE_API_KEY")
-            if not api_key:
-                st.error("GOOGLE_API_KEY environment variable is not set!")
-                return None
-            
-            rag_manager = RAGPipelineManager(doc_store, api_key)
-            return rag_manager
-            
-        except Exception as e:
-            st.error(f"RAG sistemi başlatılamadı: {str(e)}")
-            return None
+    return diskcache.Cache(ANSWER_CACHE_DIR)
 
 
-def display_chat_message(message: str, is_user: bool = True):
+def stream_answer(rag_manager: RAGPipelineManager, question: str, top_k: int, doc_store_key: str) -> Dict[str, Any]:
+    """
+    Answer a question and render it while it is being generated.
+    
+    Cached answers for repeated questions are rendered at once.
+    
+    Args:
+        rag_manager: RAG pipeline manager
+        question: User question
+        top_k: Number of documents to retrieve
+        doc_store_key: Content hash of the document store
+        
+    Returns:
+        Response dictionary including context documents
+    """
+    answer_cache = get_answer_cache()
+    key = hashlib.sha256(f"{question}|{top_k}|{doc_store_key}".encode("utf-8")).hexdigest()
+    
+    result = answer_cache.get(key)
+    if result is not None:
+        display_chat_message(result['answer'], is_user=False)
+        return result
+    
+    placeholder = st.empty()
+    answer = ""
+    documents = []
+    failed = False
+    last_render = 0.0
+    
+    for event in rag_manager.ask_question_stream(question, top_k):
+        if 'documents' in event:
+            documents = event['documents']
+            continue
+        
+        if 'error' in event:
+            # Keep any partial answer visible and append the apology
+            answer = f"{answer}\n\n{event['error']}" if answer else event['error']
+            failed = True
+            break
+        
+        answer += event['delta']
+        # Coalesce deltas so the message is re-rendered at most once per interval
+        now = time.monotonic()
+        if now - last_render >= STREAM_RENDER_INTERVAL:
+            display_chat_message(answer, is_user=False, container=placeholder)
+            last_render = now
+    
+    display_chat_message(answer, is_user=False, container=placeholder)
+    
+    result = {
+        'answer': answer,
+        'documents': documents,
+        'query': question
+    }
+    
+    # Don't cache failed queries (even after documents or a partial answer
+    # were streamed) or answers without context
+    if documents and not failed:
+        answer_cache.set(key, result, expire=ANSWER_CACHE_TTL)
+    
+    return result
+
+
+def display_chat_message(message: str, is_user: bool = True, container=None):
     """
     Display a chat message with appropriate styling.
     
     Args:
         message: Message text
         is_user: Whether this is a user message
+        container: Streamlit container to render into (defaults to the page)
+    """
+    (container or st).markdown(chat_message_html(message, is_user), unsafe_allow_html=True)
+
+
+def chat_message_html(message: str, is_user: bool = True) -> str:
+    """
+    Build the HTML of a chat message.
+    
+    Args:
+        message: Message text
+        is_user: Whether this is a user message
+        
+    Returns:
+        HTML string
     """
     css_class = "user-message" if is_user else "bot-message"
-    st.markdown(f'<div class="chat-message {css_class}">{message}</div>', 
-                unsafe_allow_html=True)
+    return f'<div class="chat-message {css_class}">{message}</div>'
+
+
+def display_chat_history(messages: List[Dict[str, Any]], show_context: bool = True):
+    """
+    Display the chat history with a single markdown element.
+    
+    Context documents of earlier answers are grouped into one collapsed
+    expander instead of being interleaved with the messages.
+    
+    Args:
+        messages: Chat messages
+        show_context: Whether to show context documents
+    """
+    if not messages:
+        return
+    
+    st.markdown(
+        "\n".join(chat_message_html(m['content'], m['role'] == 'user') for m in messages),
+        unsafe_allow_html=True
+    )
+    
+    if not show_context:
+        return
+    
+    sections = []
+    for i, message in enumerate(messages):
+        if message['role'] != 'assistant' or not message.get('context'):
+            continue
+        question = messages[i - 1]['content'] if i > 0 else ''
+        docs_html = "".join(
+            f'<div class="context-doc"><strong>{doc.get("title", "Başlıksız")}</strong> '
+            f'<span class="score-badge">{doc.get("score", 0):.3f}</span><br>{doc.get("content", "")}'
+            + (f'<br><a href="{doc["url"]}">{doc["url"]}</a>' if doc.get('url') else '')
+            + '</div>'
+            for doc in message['context']
+        )
+        sections.append(f'<p><strong>Soru:</strong> {question}</p>{docs_html}')
+    
+    if sections:
+        with st.expander("📚 Önceki Yanıtların Kaynak Belgeleri", expanded=False):
+            st.markdown("\n".join(sections), unsafe_allow_html=True)
 
 
 def display_context_documents(documents: List[Dict[str, Any]]):
@@ -203,36 +424,19 @@ def main():
         
         st.stop()
     
-    # Initialize RAG system
-    if 'rag_manager' not in st.session_state:
-        with st.spinner("RAG sistemi başlatılıyor..."):
-            try:
-                # Load data
-                loader = SuperLigDataLoader()
-                documents = loader.load_and_prepare_data()
-                
-                # Create document store
-                doc_store = create_document_store(documents)
-                
-                # Initialize RAG pipeline
-                st.session_state.rag_manager = RAGPipelineManager(doc_store, api_key)
-                st.success("✅ RAG sistemi başarıyla yüklendi!")
-                
-            except Exception as e:
-                st.error(f"❌ RAG sistemi başlatılamadı: {str(e)}")
-                st.stop()
+    # Initialize RAG system (shared across all sessions)
+    try:
+        rag_manager, doc_store_key = initialize_rag_system(api_key)
+    except Exception as e:
+        st.error(f"❌ RAG sistemi başlatılamadı: {str(e)}")
+        st.stop()
     
     # Initialize chat history
     if 'messages' not in st.session_state:
         st.session_state.messages = []
     
     # Display chat history
-    for message in st.session_state.messages:
-        display_chat_message(message['content'], message['role'] == 'user')
-        
-        # Show context if available
-        if message['role'] == 'assistant' and 'context' in message and show_context:
-            display_context_documents(message['context'])
+    display_chat_history(st.session_state.messages, show_context)
     
     # Chat input
     st.subheader("💬 Soru Sorun")
@@ -246,11 +450,15 @@ def main():
         "Trabzonspor ne zaman kuruldu?"
     ]
     
-    cols = st.columns(2)
-    for i, question in enumerate(example_questions):
-        with cols[i % 2]:
-            if st.button(f"❓ {question}", key=f"example_{i}"):
-                st.session_state.user_input = question
+    # One form submits the clicked example in a single rerun
+    with st.form("examples", clear_on_submit=True):
+        cols = st.columns(2)
+        picks = [
+            cols[i % 2].form_submit_button(f"❓ {question}")
+            for i, question in enumerate(example_questions)
+        ]
+    if any(picks):
+        st.session_state.user_input = example_questions[picks.index(True)]
     
     # Text input
     user_input = st.text_input(
@@ -279,9 +487,12 @@ def main():
             # Get answer from RAG system
             with st.spinner("🤔 Düşünüyorum..."):
                 try:
-                    result = st.session_state.rag_manager.ask_question(
-                        user_input, 
-                        show_context=show_context
+                    # Streams the answer into the page as it is generated
+                    result = stream_answer(
+                        rag_manager,
+                        user_input,
+                        top_k,
+                        doc_store_key
                     )
                     
                     # Add assistant response to chat
@@ -295,9 +506,6 @@ def main():
                     
                     st.session_state.messages.append(response_data)
                     
-                    # Display assistant response
-                    display_chat_message(result['answer'], is_user=False)
-                    
                     # Display context documents
                     if show_context and 'documents' in result:
                         display_context_documents(result['documents'])
@@ -3,44 +3,219 @@ Data loader for Turkish SuperLig Wikipedia dataset.
 Loads and preprocesses the dataset for RAG pipeline.
 """
 
-import re
-from typing import List, Dict, Any
-from datasets import load_dataset
-from haystack import Document
-from haystack.document_stores.in_memory import InMemoryDocumentStore
+import hashlib
+import logging
+import multiprocessing
+import os
+import sqlite3
+from dataclasses import replace
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from embeddings import EMBEDDING_BACKEND, EMBEDDING_MODEL
+
+# Heavy dependencies are imported where they are used so importing this
+# module (e.g. on a Streamlit cold start) stays cheap
+if TYPE_CHECKING:
+    from datasketch import MinHash
+    from haystack import Document
+    from haystack.document_stores.in_memory import InMemoryDocumentStore
+
+
+logger = logging.getLogger(__name__)
+
+# Punctuation kept by preprocess_text besides letters, digits and whitespace
+_KEPT_PUNCTUATION = frozenset('_.,!?()-')
+
+
+class _SpecialCharTable(dict):
+    r"""
+    str.translate table deleting special characters.
+    
+    Keeps the characters matched by the regex class [\w\s.,!?()-]: letters
+    (Turkish included) and digits of any script, whitespace and a few
+    punctuation marks. Entries are filled in on first lookup, so only code
+    points that actually occur in the corpus are stored.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char.isspace() or char in _KEPT_PUNCTUATION else None
+        self[codepoint] = value
+        return value
+
+
+_SPECIAL_CHARS_TABLE = _SpecialCharTable()
+
+# Datasets with at least this many items are chunked in a process pool
+PARALLEL_MIN_ITEMS = 256
+# Number of items sent to a worker process at a time
+PARALLEL_CHUNKSIZE = 32
+# Start method of the chunking pool; forking from Streamlit's multi-threaded
+# script runner can deadlock, so workers start in fresh interpreters
+PARALLEL_START_METHOD = "spawn"
+
+# Bump when preprocess_text, chunk_text or deduplication change their output;
+# part of preprocessing_key, which keys cached chunks
+PREPROCESSING_VERSION = 1
+
+# Maximum characters per chunk and characters shared by consecutive chunks
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+
+# Chunks with estimated Jaccard similarity above this are near-duplicates
+DEDUP_THRESHOLD = 0.9
+# Number of MinHash permutations per chunk
+DEDUP_NUM_PERM = 128
+# Number of words per shingle
+DEDUP_SHINGLE_SIZE = 5
+
+# Number of documents embedded and written to the store at a time
+EMBEDDING_WRITE_BATCH_SIZE = 256
+
+# Number of keys looked up in the embedding cache per SQL query
+EMBEDDING_CACHE_LOOKUP_SIZE = 500
+
+# Directory for on-disk caches (embedded documents etc.)
+CACHE_DIR = os.path.join(".", ".cache")
+
+# Number of saved document stores kept on disk; older ones are deleted
+DOCUMENT_STORE_CACHE_KEEP = 2
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process may run on.
+    
+    Unlike os.cpu_count(), respects CPU affinity (e.g. taskset or a
+    container's cpuset) where the platform supports it.
+    
+    Returns:
+        Number of usable CPUs, at least 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+class _NearDuplicateIndex:
+    """MinHash LSH index for finding near-duplicate chunks."""
+    
+    def __init__(self, threshold: float = DEDUP_THRESHOLD, num_perm: int = DEDUP_NUM_PERM):
+        """
+        Initialize the index.
+        
+        Args:
+            threshold: Estimated Jaccard similarity above which chunks are duplicates
+            num_perm: Number of MinHash permutations
+        """
+        from datasketch import MinHashLSH
+        
+        self.num_perm = num_perm
+        self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        self.documents = {}
+    
+    def signature(self, text: str) -> 'MinHash':
+        """
+        Compute the MinHash signature of a text over word shingles.
+        
+        Args:
+            text: Text to hash
+            
+        Returns:
+            MinHash signature
+        """
+        from datasketch import MinHash
+        
+        words = text.lower().split()
+        size = DEDUP_SHINGLE_SIZE
+        shingles = {' '.join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))}
+        
+        minhash = MinHash(num_perm=self.num_perm)
+        minhash.update_batch([shingle.encode('utf-8') for shingle in shingles])
+        return minhash
+    
+    def find(self, minhash: 'MinHash') -> Optional['Document']:
+        """
+        Find a previously added near-duplicate.
+        
+        Args:
+            minhash: Signature to look up
+            
+        Returns:
+            Matching Document, or None if the signature is new
+        """
+        matches = self.lsh.query(minhash)
+        return self.documents[matches[0]] if matches else None
+    
+    def add(self, doc: 'Document', minhash: 'MinHash'):
+        """
+        Add a document to the index.
+        
+        Args:
+            doc: Document to add
+            minhash: Signature of the document content
+        """
+        key = str(len(self.documents))
+        self.lsh.insert(key, minhash)
+        self.documents[key] = doc
 
 
 class SuperLigDataLoader:
     """Data loader for SuperLig Wikipedia dataset."""
     
-    def __init__(self, dataset_name: str = "aldemirburak/superligwikipedia"):
+    def __init__(self, dataset_name: str = "aldemirburak/superligwikipedia", deduplicate: bool = True):
         """
         Initialize the data loader.
         
         Args:
             dataset_name: Name of the SuperLig Wikipedia dataset
+            deduplicate: Whether to drop near-duplicate chunks before embedding
         """
         self.dataset_name = dataset_name
+        self.deduplicate = deduplicate
         self.documents = []
+        # Set by load_dataset when the dataset could not be loaded
+        self.using_sample_data = False
     
     def load_dataset(self) -> List[Dict[str, Any]]:
         """
         Load the SuperLig Wikipedia dataset from Hugging Face.
         
+        The dataset is not streamed: streaming bypasses the local Hugging
+        Face cache, so every run would download it again.
+        
         Returns:
             List of document dictionaries
         """
+        from datasets import load_dataset
+        
         try:
-            # Load SuperLig Wikipedia dataset
-            dataset = load_dataset("aldemirburak/superligwikipedia")
-            print(f"Loaded SuperLig dataset with {len(dataset['train'])} documents")
-            return dataset['train']
+            # Load SuperLig Wikipedia dataset (from the local cache after the first run)
+            dataset = load_dataset(self.dataset_name, split="train")
+            logger.info("Loaded SuperLig dataset with %d documents", len(dataset))
+            return dataset
         except Exception as e:
-            print(f"Error loading SuperLig dataset: {e}")
-            print("Falling back to sample data...")
+            logger.warning("Error loading SuperLig dataset: %s", e)
+            logger.warning("Falling back to sample data...")
             # Fallback: create sample SuperLig data
+            self.using_sample_data = True
             return self._create_sample_data()
     
+    def get_dataset_revision(self) -> str:
+        """
+        Get the current commit SHA of the dataset on the Hugging Face Hub.
+        
+        Returns:
+            Commit SHA, or an empty string if the Hub cannot be reached
+        """
+        from huggingface_hub import HfApi
+        
+        try:
+            return HfApi().dataset_info(self.dataset_name).sha or ""
+        except Exception as e:
+            logger.warning("Could not get revision of %s: %s", self.dataset_name, e)
+            return ""
+    
     def _create_sample_data(self) -> List[Dict[str, Any]]:
         """
         Create sample SuperLig data if dataset loading fails.
@@ -100,7 +275,7 @@ class SuperLigDataLoader:
                 "url": "https://tr.wikipedia.org/wiki/Hatayspor"
             }
         ]
-        print("Using enhanced sample SuperLig data")
+        logger.info("Using enhanced sample SuperLig data")
         return sample_data
     
     def preprocess_text(self, text: str) -> str:
@@ -113,18 +288,17 @@ class SuperLigDataLoader:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep Turkish characters
-        text = re.sub(r'[^\w\sçğıöşüÇĞIİÖŞÜ.,!?()-]', '', text)
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        return text
+        # Collapse whitespace, then remove special characters, then strip
+        return ' '.join(text.split()).translate(_SPECIAL_CHARS_TABLE).strip()
     
-    def chunk_text(self, text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
+    def chunk_text(self, text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
         """
         Split text into overlapping chunks.
         
+        Chunks are sized in characters, not tokens: a 500 character chunk
+        is well under the embedding model's 512 token limit, so each chunk
+        is embedded whole and only the overlap is encoded twice.
+        
         Args:
             text: Text to chunk
             chunk_size: Maximum size of each chunk
@@ -143,7 +317,9 @@ class SuperLigDataLoader:
             end = start + chunk_size
             chunk = text[start:end]
             
-            # Try to break at sentence boundary
+            # Try to break at sentence boundary. rfind only scans this
+            # chunk_size window, which is cheaper than precomputing the
+            # terminator positions of the whole text.
             if end < len(text):
                 last_period = chunk.rfind('.')
                 last_question = chunk.rfind('?')
@@ -162,118 +338,410 @@ class SuperLigDataLoader:
         
         return chunks
     
-    def create_documents(self, data: List[Dict[str, Any]]) -> List[Document]:
+    def process_item(self, item: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Preprocess and chunk a single dataset item.
+        
+        Returns plain (content, meta) tuples rather than Document objects so
+        results are cheap to send back from worker processes.
+        
+        Args:
+            item: Document dictionary
+            
+        Returns:
+            List of (chunk, meta) tuples
+        """
+        # Get text content - handle different possible field names
+        text = None
+        if 'text' in item:
+            text = item['text']
+        elif 'content' in item:
+            text = item['content']
+        elif 'article' in item:
+            text = item['article']
+        elif 'body' in item:
+            text = item['body']
+        else:
+            # Try to find any text field
+            for key, value in item.items():
+                if isinstance(value, str) and len(value) > 100:
+                    text = value
+                    break
+        
+        if not text:
+            return []
+        
+        # Preprocess text
+        text = self.preprocess_text(text)
+        
+        # Chunk the text
+        chunks = self.chunk_text(text)
+        
+        results = []
+        for i, chunk in enumerate(chunks):
+            if len(chunk.strip()) < 50:  # Skip very short chunks
+                continue
+            
+            results.append((chunk, {
+                'title': item.get('title', 'Unknown'),
+                'url': item.get('url', ''),
+                'chunk_id': i,
+                'total_chunks': len(chunks),
+                'source': 'wikipedia'
+            }))
+        
+        return results
+    
+    def create_documents(self, data: List[Dict[str, Any]]) -> List['Document']:
         """
         Create Haystack Document objects from dataset.
         
+        Large datasets are preprocessed and chunked in a process pool.
+        Near-duplicate chunks are dropped and recorded as aliases on the
+        first matching document.
+        
         Args:
             data: List of document dictionaries
             
         Returns:
             List of Haystack Document objects
         """
+        from haystack import Document
+        
+        workers = _available_cpus()
+        parallel = len(data) >= PARALLEL_MIN_ITEMS and workers > 1
+        
+        duplicate_index = _NearDuplicateIndex() if self.deduplicate else None
         documents = []
+        duplicate_count = 0
+        pool = multiprocessing.get_context(PARALLEL_START_METHOD).Pool(processes=workers) if parallel else None
         
-        for item in data:
-            # Get text content - handle different possible field names
-            text = None
-            if 'text' in item:
-                text = item['text']
-            elif 'content' in item:
-                text = item['content']
-            elif 'article' in item:
-                text = item['article']
-            elif 'body' in item:
-                text = item['body']
+        try:
+            if pool:
+                results = pool.imap(_process_item, data, chunksize=PARALLEL_CHUNKSIZE)
             else:
-                # Try to find any text field
-                for key, value in item.items():
-                    if isinstance(value, str) and len(value) > 100:
-                        text = value
-                        break
-            
-            if not text:
-                continue
-            
-            # Preprocess text
-            text = self.preprocess_text(text)
+                results = map(self.process_item, data)
             
-            # Chunk the text
-            chunks = self.chunk_text(text)
-            
-            # Create documents for each chunk
-            for i, chunk in enumerate(chunks):
-                if len(chunk.strip()) < 50:  # Skip very short chunks
-                    continue
-                
-                doc = Document(
-                    content=chunk,
-                    meta={
-                        'title': item.get('title', 'Unknown'),
-                        'url': item.get('url', ''),
-                        'chunk_id': i,
-                        'total_chunks': len(chunks),
-                        'source': 'wikipedia'
-                    }
-                )
-                documents.append(doc)
+            for item_chunks in results:
+                for chunk, meta in item_chunks:
+                    if duplicate_index:
+                        minhash = duplicate_index.signature(chunk)
+                        original = duplicate_index.find(minhash)
+                        if original is not None:
+                            aliases = original.meta.setdefault('aliases', [])
+                            if meta['title'] != original.meta['title'] and meta['title'] not in aliases:
+                                aliases.append(meta['title'])
+                            duplicate_count += 1
+                            continue
+                    
+                    doc = Document(content=chunk, meta=meta)
+                    if duplicate_index:
+                        duplicate_index.add(doc, minhash)
+                    documents.append(doc)
+        finally:
+            if pool:
+                pool.terminate()
+        
+        logger.info("Processed %d articles, skipped %d near-duplicate chunks", len(data), duplicate_count)
         
         self.documents = documents
-        print(f"Created {len(documents)} document chunks")
+        logger.info("Created %d document chunks", len(documents))
         return documents
     
-    def load_and_prepare_data(self) -> List[Document]:
+    def load_and_prepare_data(self) -> List['Document']:
         """
         Load dataset and prepare documents for RAG pipeline.
         
         Returns:
             List of prepared Document objects
         """
-        print("Loading Turkish Wikipedia dataset...")
+        logger.info("Loading Turkish Wikipedia dataset...")
         raw_data = self.load_dataset()
         
-        print("Preprocessing and chunking documents...")
+        logger.info("Preprocessing and chunking documents...")
         documents = self.create_documents(raw_data)
         
         return documents
 
 
-def create_document_store(documents: List[Document]) -> InMemoryDocumentStore:
+def preprocessing_key() -> str:
     """
-    Create and populate an InMemoryDocumentStore with documents.
+    Describe the preprocessing, chunking and deduplication settings.
+    
+    Returns:
+        String that changes whenever the chunks of a dataset revision would
+    """
+    return (f"v{PREPROCESSING_VERSION}|chunk={CHUNK_SIZE},{CHUNK_OVERLAP}"
+            f"|dedup={DEDUP_THRESHOLD},{DEDUP_NUM_PERM},{DEDUP_SHINGLE_SIZE}")
+
+
+# Loader used by worker processes; process_item doesn't depend on loader state
+_ITEM_LOADER = SuperLigDataLoader()
+
+
+def _process_item(item: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Preprocess and chunk a single dataset item in a worker process.
+    
+    A module-level function is pickled by name, so each task only carries
+    the items; a bound method would pickle the whole loader, including
+    the documents of earlier create_documents calls.
+    
+    Args:
+        item: Document dictionary
+        
+    Returns:
+        List of (chunk, meta) tuples
+    """
+    return _ITEM_LOADER.process_item(item)
+
+
+def document_store_key(documents: List['Document'], model: str = EMBEDDING_MODEL) -> str:
+    """
+    Compute a content hash identifying an embedded document store.
     
     Args:
         documents: List of Document objects to store
+        model: Name of the embedding model
         
     Returns:
-        Configured InMemoryDocumentStore
+        Hex digest that changes whenever the documents, model or backend change
     """
-    # Create document store
-    document_store = InMemoryDocumentStore()
+    # Quantized backends produce different embeddings, so they get their own key
+    hasher = hashlib.sha256(f"{model}|{EMBEDDING_BACKEND}".encode("utf-8"))
+    for doc in documents:
+        # Document ids are derived from content and meta (title, url, chunk_id)
+        hasher.update(b"\0")
+        hasher.update(doc.id.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class _EmbeddingCache:
+    """
+    SQLite store of document embeddings keyed by a hash of the content.
     
-    # Generate embeddings for documents first
-    from haystack.components.embedders import SentenceTransformersDocumentEmbedder
+    Like the other on-disk caches, failures (read-only or full disk, a
+    database locked by another process) are logged and the cache then
+    behaves as empty instead of aborting the embedding step.
+    """
     
-    print("Generating embeddings for documents...")
-    doc_embedder = SentenceTransformersDocumentEmbedder(
-        model="trmteb/turkish-embedding-model"
-    )
+    def __init__(self, path: str):
+        """
+        Open the cache, creating it if needed.
+        
+        Args:
+            path: Path of the SQLite database
+        """
+        self.path = path
+        self.connection = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.connection = sqlite3.connect(path)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not open embedding cache %s: %s", path, e)
+            self.close()
     
-    # Warm up the embedder
-    doc_embedder.warm_up()
+    @staticmethod
+    def key(doc: 'Document') -> str:
+        """
+        Compute the cache key of a document.
+        
+        Embeddings only depend on the content, so documents whose meta
+        changed (e.g. chunk_id) still hit the cache.
+        
+        Args:
+            doc: Document to embed
+            
+        Returns:
+            Hex digest of the document content
+        """
+        return hashlib.sha256(doc.content.encode("utf-8")).hexdigest()
     
-    # Generate embeddings for documents
-    result = doc_embedder.run(documents=documents)
-    embedded_documents = result["documents"]
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached embeddings.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of the keys found to their embeddings
+        """
+        found = {}
+        if self.connection is None:
+            return found
+        
+        try:
+            for start in range(0, len(keys), EMBEDDING_CACHE_LOOKUP_SIZE):
+                batch = keys[start:start + EMBEDDING_CACHE_LOOKUP_SIZE]
+                rows = self.connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        except sqlite3.Error as e:
+            logger.warning("Could not read embedding cache %s: %s", self.path, e)
+        return found
     
-    # Write embedded documents to store
-    document_store.write_documents(embedded_documents)
+    def put_many(self, docs: List['Document']):
+        """
+        Store the embeddings of embedded documents.
+        
+        Args:
+            docs: Documents with embeddings
+        """
+        if self.connection is None:
+            return
+        
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                    [(self.key(doc), np.asarray(doc.embedding, dtype=np.float32).tobytes()) for doc in docs]
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not write embedding cache %s: %s", self.path, e)
+    
+    def close(self):
+        """Close the database."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def _load_cached_store(cache_path: str) -> Optional['InMemoryDocumentStore']:
+    """
+    Load an embedded document store from the disk cache.
+    
+    Args:
+        cache_path: Path of the saved document store
+        
+    Returns:
+        InMemoryDocumentStore, or None on cache miss
+    """
+    from haystack.document_stores.in_memory import InMemoryDocumentStore
+    
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        return InMemoryDocumentStore.load_from_disk(cache_path)
+    except Exception as e:
+        logger.warning("Could not read document store cache %s: %s", cache_path, e)
+        return None
+
+
+def _save_cached_store(cache_path: str, document_store: 'InMemoryDocumentStore'):
+    """
+    Save an embedded document store to the disk cache.
+    
+    Every corpus, model or backend change writes a new store, so only the
+    DOCUMENT_STORE_CACHE_KEEP most recently written ones are kept.
+    
+    Args:
+        cache_path: Path of the saved document store
+        document_store: Document store with embedded documents
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a truncated cache
+        tmp_path = f"{cache_path}.tmp"
+        document_store.save_to_disk(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning("Could not write document store cache %s: %s", cache_path, e)
+        return
+    
+    cache_dir = os.path.dirname(cache_path)
+    saved = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+             if name.startswith("docstore_") and name.endswith(".json")]
+    saved.sort(key=os.path.getmtime, reverse=True)
+    for path in saved[DOCUMENT_STORE_CACHE_KEEP:]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning("Could not remove old document store cache %s: %s", path, e)
+
+
+def create_document_store(documents: List['Document'],
+                          model: str = EMBEDDING_MODEL,
+                          cache_dir: str = CACHE_DIR) -> 'InMemoryDocumentStore':
+    """
+    Create and populate an InMemoryDocumentStore with documents.
+    
+    The populated store is saved to disk keyed by a hash of the documents
+    and the model name, so later runs load it in one step and skip the
+    embedding step entirely. When the corpus changed, embeddings of
+    unchanged chunks are reused from a per-document embedding cache and
+    only new chunks are embedded.
     
-    print(f"Document store created with {len(documents)} documents and embeddings")
+    Args:
+        documents: List of Document objects to store
+        model: Name of the embedding model
+        cache_dir: Directory for the document store cache
+        
+    Returns:
+        Configured InMemoryDocumentStore
+    """
+    from haystack.document_stores.in_memory import InMemoryDocumentStore
+    from embeddings import create_document_embedder, quantize_embedder
+    
+    cache_path = os.path.join(cache_dir, f"docstore_{document_store_key(documents, model)}.json")
+    document_store = _load_cached_store(cache_path)
+    
+    if document_store is not None:
+        logger.info("Loaded %d embedded documents from cache", document_store.count_documents())
+    else:
+        # Create document store
+        document_store = InMemoryDocumentStore()
+        
+        # Reuse embeddings of chunks embedded by earlier runs
+        model_name = model.replace("/", "_")
+        embedding_cache = _EmbeddingCache(os.path.join(cache_dir, f"embeddings_{model_name}_{EMBEDDING_BACKEND}.db"))
+        try:
+            keys = [_EmbeddingCache.key(doc) for doc in documents]
+            cached = embedding_cache.get_many(keys)
+            hits = [replace(doc, embedding=cached[key]) for doc, key in zip(documents, keys) if key in cached]
+            missing = [doc for doc, key in zip(documents, keys) if key not in cached]
+            if hits:
+                document_store.write_documents(hits)
+                logger.info("Reused cached embeddings for %d documents", len(hits))
+            
+            if missing:
+                # Generate embeddings for documents first
+                logger.info("Generating embeddings for %d documents...", len(missing))
+                doc_embedder = create_document_embedder(model)
+                
+                # Warm up the embedder
+                doc_embedder.warm_up()
+                quantize_embedder(doc_embedder)
+                
+                # Sort by length so every batch, not just each encode call, pads to
+                # similar lengths; the store doesn't depend on write order
+                by_length = sorted(missing, key=lambda doc: len(doc.content))
+                
+                # Embed and write documents batch by batch
+                for start in range(0, len(by_length), EMBEDDING_WRITE_BATCH_SIZE):
+                    batch = by_length[start:start + EMBEDDING_WRITE_BATCH_SIZE]
+                    result = doc_embedder.run(documents=batch)
+                    document_store.write_documents(result["documents"])
+                    embedding_cache.put_many(result["documents"])
+        finally:
+            embedding_cache.close()
+        
+        _save_cached_store(cache_path, document_store)
+    
+    logger.info("Document store created with %d documents and embeddings", document_store.count_documents())
     return document_store
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Test the data loader
     loader = SuperLigDataLoader()
     documents = loader.load_and_prepare_data()
@@ -0,0 +1,263 @@
+"""
+Embedding model configuration for Turkish RAG Chatbot.
+Creates document and query embedders sharing the same device and precision.
+"""
+
+import functools
+import logging
+import os
+from typing import Dict, Any, TYPE_CHECKING
+
+# torch and haystack are imported where they are used so that reading the
+# constants below (e.g. from data_loader) doesn't load them
+if TYPE_CHECKING:
+    from haystack.utils import ComponentDevice
+    from haystack.components.embedders import SentenceTransformersDocumentEmbedder, SentenceTransformersTextEmbedder
+
+
+logger = logging.getLogger(__name__)
+
+
+# Embedding model used for both documents and queries
+EMBEDDING_MODEL = "trmteb/turkish-embedding-model"
+
+# Number of documents encoded per forward pass
+DOCUMENT_BATCH_SIZE = 128
+
+# Inference backend: "torch", "torch-int8" for a dynamically quantized
+# PyTorch model on CPU, "onnx" for a graph-optimized ONNX Runtime model on
+# CPU or CUDA, or "onnx-int8" for a dynamically quantized ONNX model on CPU
+# (the ONNX backends require `pip install sentence-transformers[onnx]`, or
+# `[onnx-gpu]` for CUDA)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+
+# CPU threads used by PyTorch for each forward pass; unset keeps PyTorch's
+# default (physical cores), which os.cpu_count() would overshoot on SMT
+# hosts and CPU-quota containers
+TORCH_NUM_THREADS = int(os.environ["TORCH_NUM_THREADS"]) if os.getenv("TORCH_NUM_THREADS") else None
+
+# OpenMP and MKL size their thread pools when torch is first imported, which
+# only happens after this module is loaded (torch is imported lazily)
+if TORCH_NUM_THREADS is not None:
+    os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_NUM_THREADS))
+    os.environ.setdefault("MKL_NUM_THREADS", str(TORCH_NUM_THREADS))
+
+# Directory of the exported graph-optimized ONNX model and its file inside it
+ONNX_OPTIMIZED_DIR = os.path.join(".", ".cache", "onnx-o3")
+ONNX_OPTIMIZED_FILE = "onnx/model_O3.onnx"
+
+# Directory of the exported int8 ONNX model and its file inside it
+ONNX_INT8_DIR = os.path.join(".", ".cache", "onnx-int8")
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+@functools.lru_cache(maxsize=None)
+def configure_torch_threads():
+    """
+    Pin PyTorch's CPU thread pools, once per process.
+    
+    A single forward pass uses TORCH_NUM_THREADS intra-op threads if set,
+    otherwise PyTorch's default; the encoder graph is sequential, so
+    inter-op parallelism only adds scheduling overhead.
+    """
+    import torch
+    
+    if TORCH_NUM_THREADS is not None:
+        torch.set_num_threads(TORCH_NUM_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError as e:
+        # Only possible before any inter-op parallel work has started
+        logger.warning("Could not set PyTorch inter-op threads: %s", e)
+
+
+def get_embedding_device() -> 'ComponentDevice':
+    """
+    Select the device for the embedding model.
+    
+    Returns:
+        First CUDA device if available, otherwise CPU
+    """
+    import torch
+    from haystack.utils import ComponentDevice
+    
+    if torch.cuda.is_available():
+        return ComponentDevice.from_str("cuda:0")
+    return ComponentDevice.from_str("cpu")
+
+
+def get_model_kwargs() -> Dict[str, Any]:
+    """
+    Select model loading arguments for the embedding model.
+    
+    Returns:
+        Keyword arguments passed to the underlying transformers model
+    """
+    import torch
+    
+    # FP16 halves memory traffic on GPU. CPUs without native BF16/FP16 units
+    # emulate half precision and run slower than FP32, so keep FP32 there.
+    if torch.cuda.is_available():
+        return {"torch_dtype": "float16"}
+    return {}
+
+
+def export_optimized_onnx_model(model: str = EMBEDDING_MODEL, save_dir: str = ONNX_OPTIMIZED_DIR) -> str:
+    """
+    Export the embedding model to a graph-optimized ONNX model.
+    
+    Uses Optimum's O3 level: all ONNX Runtime graph optimizations (constant
+    folding, node elimination) plus transformer fusions such as
+    LayerNorm, attention and GELU. The export runs once; later calls reuse
+    the saved model.
+    
+    Args:
+        model: Name of the embedding model
+        save_dir: Directory to save the exported model to
+        
+    Returns:
+        Directory containing the exported model
+    """
+    if os.path.exists(os.path.join(save_dir, ONNX_OPTIMIZED_FILE)):
+        return save_dir
+    
+    from sentence_transformers import SentenceTransformer, export_optimized_onnx_model as export_model
+    
+    logger.info("Exporting %s to optimized ONNX...", model)
+    onnx_model = SentenceTransformer(model, backend="onnx")
+    onnx_model.save(save_dir)
+    export_model(onnx_model, "O3", save_dir)
+    return save_dir
+
+
+def export_quantized_onnx_model(model: str = EMBEDDING_MODEL, save_dir: str = ONNX_INT8_DIR) -> str:
+    """
+    Export the embedding model to a dynamically quantized int8 ONNX model.
+    
+    The export runs once; later calls reuse the saved model.
+    
+    Args:
+        model: Name of the embedding model
+        save_dir: Directory to save the exported model to
+        
+    Returns:
+        Directory containing the exported model
+    """
+    if os.path.exists(os.path.join(save_dir, ONNX_INT8_FILE)):
+        return save_dir
+    
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    
+    logger.info("Exporting %s to int8 ONNX...", model)
+    onnx_model = SentenceTransformer(model, backend="onnx")
+    onnx_model.save(save_dir)
+    export_dynamic_quantized_onnx_model(onnx_model, "avx512_vnni", save_dir)
+    return save_dir
+
+
+def get_embedder_kwargs(model: str = EMBEDDING_MODEL) -> Dict[str, Any]:
+    """
+    Select the arguments shared by the document and query embedders.
+    
+    Args:
+        model: Name of the embedding model
+        
+    Returns:
+        Keyword arguments for the SentenceTransformers embedders
+    """
+    import torch
+    from haystack.utils import ComponentDevice
+    
+    configure_torch_threads()
+    
+    if EMBEDDING_BACKEND == "onnx":
+        provider = "CUDAExecutionProvider" if torch.cuda.is_available() else "CPUExecutionProvider"
+        return {
+            "model": export_optimized_onnx_model(model),
+            "device": get_embedding_device(),
+            "backend": "onnx",
+            "model_kwargs": {"file_name": ONNX_OPTIMIZED_FILE, "provider": provider}
+        }
+    
+    if EMBEDDING_BACKEND == "onnx-int8":
+        return {
+            "model": export_quantized_onnx_model(model),
+            "device": ComponentDevice.from_str("cpu"),
+            "backend": "onnx",
+            "model_kwargs": {"file_name": ONNX_INT8_FILE}
+        }
+    
+    if EMBEDDING_BACKEND == "torch-int8":
+        # Dynamically quantized kernels only run on CPU
+        return {
+            "model": model,
+            "device": ComponentDevice.from_str("cpu")
+        }
+    
+    return {
+        "model": model,
+        "device": get_embedding_device(),
+        "model_kwargs": get_model_kwargs()
+    }
+
+
+def quantize_embedder(embedder: Any):
+    """
+    Quantize the linear layers of a warmed-up embedder to int8 in place.
+    
+    Only applies to the "torch-int8" backend; other backends are left as is.
+    Weights are stored as int8 and activations are quantized on the fly,
+    which cuts the memory read by each linear layer to a quarter.
+    
+    Args:
+        embedder: Warmed-up SentenceTransformers document or text embedder
+    """
+    if EMBEDDING_BACKEND != "torch-int8":
+        return
+    
+    import torch
+    
+    torch.quantization.quantize_dynamic(
+        embedder.embedding_backend.model,
+        {torch.nn.Linear},
+        dtype=torch.qint8,
+        inplace=True
+    )
+
+
+def create_document_embedder(model: str = EMBEDDING_MODEL) -> 'SentenceTransformersDocumentEmbedder':
+    """
+    Create the document embedder used for indexing.
+    
+    Args:
+        model: Name of the embedding model
+        
+    Returns:
+        Configured SentenceTransformersDocumentEmbedder
+    """
+    from haystack.components.embedders import SentenceTransformersDocumentEmbedder
+    
+    return SentenceTransformersDocumentEmbedder(
+        batch_size=DOCUMENT_BATCH_SIZE,
+        **get_embedder_kwargs(model)
+    )
+
+
+def create_text_embedder(model: str = EMBEDDING_MODEL) -> 'SentenceTransformersTextEmbedder':
+    """
+    Create the text embedder used for queries.
+    
+    Uses the same backend, device and precision as the document embedder so
+    query and document embeddings are comparable. Haystack caches loaded
+    models by these arguments, so both embedders (and every pipeline in the
+    process) share a single copy of the model.
+    
+    Args:
+        model: Name of the embedding model
+        
+    Returns:
+        Configured SentenceTransformersTextEmbedder
+    """
+    from haystack.components.embedders import SentenceTransformersTextEmbedder
+    
+    return SentenceTransformersTextEmbedder(**get_embedder_kwargs(model))
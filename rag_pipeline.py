@@ -3,20 +3,97 @@ RAG Pipeline implementation using Haystack 2.x.
 Combines retrieval and generation for Turkish language chatbot.
 """
 
+import asyncio
+import logging
 import os
-from typing import List, Dict, Any, Optional
-from haystack import Pipeline
+import time
+from typing import List, Dict, Any, Iterator, Mapping, Optional, Tuple
+import numpy as np
+from haystack import Document, Pipeline
 from haystack.document_stores.in_memory import InMemoryDocumentStore
-from haystack.components.retrievers import InMemoryEmbeddingRetriever
-from haystack.components.builders import PromptBuilder
-from haystack.components.embedders import SentenceTransformersDocumentEmbedder, SentenceTransformersTextEmbedder
-from sentence_transformers import SentenceTransformer
 import google.generativeai as genai
 from dotenv import load_dotenv
+from embeddings import create_text_embedder, quantize_embedder
+from response_cache import ExactCache, SemanticCache
+from retriever import MatrixEmbeddingRetriever
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Gemini model used for answers
+GEMINI_MODEL = 'gemini-2.0-flash-exp'
+# Gemini model used by batch_query; Batch Mode does not serve experimental models
+GEMINI_BATCH_MODEL = 'gemini-2.0-flash'
+# Seconds between status checks of a Gemini batch job
+BATCH_POLL_INTERVAL = 30
+# Batch job states after which the job no longer runs
+BATCH_DONE_STATES = {'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'}
+
+# Dummy question encoded once by warm_up
+WARM_UP_QUESTION = "Süper Lig ısınma sorusu"
+
+# Fixed parts of the prompt sent to Gemini, around the context and the question;
+# joined by TurkishRAGPipeline._build_prompt
+_PROMPT_HEAD = "Sen Türkçe bir futbol asistanısın. Aşağıdaki bağlam bilgilerini kullanarak kullanıcının sorusunu Türkçe olarak yanıtla.\n\nBağlam:\n"
+_PROMPT_MID = "\n\nSoru: "
+_PROMPT_TAIL = "\n\nYanıt:"
+
+
+def _doc_to_dict(doc: Document) -> Dict[str, Any]:
+    """
+    Convert a retrieved document to a plain dictionary.
+    
+    Args:
+        doc: Retrieved Haystack document
+        
+    Returns:
+        Dictionary with content, title, url and score
+    """
+    meta = doc.meta
+    return {
+        'content': doc.content,
+        'title': meta.get('title', 'Unknown'),
+        'url': meta.get('url', ''),
+        'score': doc.score or 0.0
+    }
+
+
+def _thaw(cached: Mapping[str, Any], question: str) -> Dict[str, Any]:
+    """
+    Build a response from a read-only cached response.
+    
+    Cache hits and misses return the same shape: the documents become a
+    list of plain dicts again. Only the small per-document dicts are
+    copied; the content strings are shared with the cache.
+    
+    Args:
+        cached: Response from ExactCache or SemanticCache
+        question: User question
+        
+    Returns:
+        Dictionary containing answer, retrieved documents and query
+    """
+    return {
+        'answer': cached['answer'],
+        'documents': [dict(doc) for doc in cached['documents']],
+        'query': question
+    }
+
+
+def _retrieval_only_answer(documents: List[Dict[str, Any]]) -> str:
+    """
+    Build the answer given when no Google API key is configured.
+    
+    Args:
+        documents: Retrieved document dictionaries
+        
+    Returns:
+        Answer text reporting the number of retrieved documents
+    """
+    return f"API key bulunamadı. {len(documents)} belge bulundu. API key ayarlayarak tam yanıt alabilirsiniz."
+
 
 class TurkishRAGPipeline:
     """RAG Pipeline for Turkish language chatbot using Haystack 2.x and Google Gemini."""
@@ -33,18 +110,22 @@ class TurkishRAGPipeline:
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         
         if not self.api_key:
-            print("Warning: No Google API key provided. Generation will not work, but retrieval will.")
+            logger.warning("No Google API key provided. Generation will not work, but retrieval will.")
         
         # Configure Google Gemini (only if API key is available)
         if self.api_key:
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.model = genai.GenerativeModel(GEMINI_MODEL)
         else:
             self.model = None
         
+        # Answers of recent questions, reused for repeated and similar questions
+        self.exact_cache = ExactCache()
+        self.semantic_cache = SemanticCache()
+        
         # Initialize components
+        self.encoder = None
         self.retriever = None
-        self.prompt_builder = None
         self.pipeline = None
         
         self._setup_components()
@@ -52,51 +133,155 @@ class TurkishRAGPipeline:
     
     def _setup_components(self):
         """Setup Haystack components for the RAG pipeline."""
-        # Initialize Turkish embedding model
-        print("Loading Turkish embedding model...")
-        self.embedding_model = SentenceTransformer('trmteb/turkish-embedding-model')
-        
-        # Create document embedder
-        self.doc_embedder = SentenceTransformersDocumentEmbedder(
-            model="trmteb/turkish-embedding-model"
-        )
+        # Create text embedder for queries (the model is loaded by warm_up)
+        self.text_embedder = create_text_embedder()
         
-        # Create text embedder for queries
-        self.text_embedder = SentenceTransformersTextEmbedder(
-            model="trmteb/turkish-embedding-model"
-        )
-        
-        # Create retriever
-        self.retriever = InMemoryEmbeddingRetriever(
+        # Create retriever over a contiguous embedding matrix (cosine similarity)
+        self.retriever = MatrixEmbeddingRetriever(
             document_store=self.document_store,
             top_k=5  # Retrieve top 5 most relevant documents
         )
-        
-        # Create prompt template for Turkish responses
-        prompt_template = """Sen Türkçe bir futbol asistanısın. Aşağıdaki bağlam bilgilerini kullanarak kullanıcının sorusunu Türkçe olarak yanıtla.
-
-Bağlam:
-{% for doc in documents %}
-{{ doc.content }}
-{% endfor %}
-
-Soru: {{ query }}
-
-Yanıt:"""
-        
-        # Create prompt builder
-        self.prompt_builder = PromptBuilder(template=prompt_template)
     
     def _create_pipeline(self):
-        """Create the Haystack RAG pipeline."""
+        """
+        Create the Haystack pipeline of the query components.
+        
+        Kept for offline runs and debugging only: queries call the encoder
+        and the retriever directly, skipping Pipeline.run's per-call input
+        validation and graph scheduling.
+        """
         self.pipeline = Pipeline()
         self.pipeline.add_component("text_embedder", self.text_embedder)
         self.pipeline.add_component("retriever", self.retriever)
-        self.pipeline.add_component("prompt_builder", self.prompt_builder)
         
         # Connect components
         self.pipeline.connect("text_embedder.embedding", "retriever.query_embedding")
-        self.pipeline.connect("retriever.documents", "prompt_builder.documents")
+    
+    def warm_up(self):
+        """
+        Load the query embedding model so the first question doesn't pay for it.
+        
+        Also runs one dummy question through the encoder and the retriever,
+        so one-time costs of the first forward pass (kernel selection,
+        allocator growth, lazy initialization) happen here.
+        """
+        logger.info("Loading Turkish embedding model...")
+        self.text_embedder.warm_up()
+        quantize_embedder(self.text_embedder)
+        # Questions are encoded with the embedder's model directly
+        self.encoder = self.text_embedder.embedding_backend.model
+        
+        try:
+            self.retriever.run(query_embedding=self._embed_question(WARM_UP_QUESTION))
+        except Exception as e:
+            logger.warning("Warm-up query failed: %s", e)
+    
+    def _build_prompt(self, question: str, context_docs: List[Dict[str, Any]]) -> str:
+        """
+        Build the Gemini prompt for a question.
+        
+        Args:
+            question: User question
+            context_docs: Retrieved document dictionaries
+            
+        Returns:
+            Prompt text
+        """
+        # One join over the context; str.join sizes the result once
+        context_text = "\n\n".join([doc['content'] for doc in context_docs])
+        return "".join((_PROMPT_HEAD, context_text, _PROMPT_MID, question, _PROMPT_TAIL))
+    
+    def _embed_question(self, question: str) -> np.ndarray:
+        """
+        Embed a question with the query embedding model.
+        
+        Args:
+            question: User question
+            
+        Returns:
+            L2-normalized question embedding
+        """
+        if self.encoder is None:
+            self.warm_up()
+        
+        return self.encoder.encode(
+            question,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+    
+    def _lookup_exact(self, question: str, top_k: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Look up the answer of an exact repeat of a question.
+        
+        Exact repeats skip embedding, retrieval and generation.
+        
+        Args:
+            question: User question
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Tuple of the exact cache key and the cached response (or None)
+        """
+        cache_key = ExactCache.key(question, top_k)
+        cached = self.exact_cache.get(cache_key)
+        return cache_key, (_thaw(cached, question) if cached is not None else None)
+    
+    def _lookup_semantic(self, query_embedding: np.ndarray, documents: List[Document],
+                         question: str, top_k: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up the answer of a similar question.
+        
+        Questions that differ in a single entity ("Trabzonspor ne zaman
+        kuruldu?" / "Beşiktaş ne zaman kuruldu?") can embed above the
+        similarity threshold, so a hit also requires the new question to
+        have retrieved the same documents as the cached one. Retrieval is
+        one FAISS call; the Gemini call is still skipped.
+        
+        Args:
+            query_embedding: Question embedding
+            documents: Documents retrieved for the question
+            question: User question
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Cached response, or None on cache miss
+        """
+        cached = self.semantic_cache.get(query_embedding, top_k, [doc.id for doc in documents])
+        return _thaw(cached, question) if cached is not None else None
+    
+    def _retrieve(self, query_embedding: np.ndarray, top_k: int) -> List[Document]:
+        """
+        Retrieve the documents most similar to a question embedding.
+        
+        Args:
+            query_embedding: Question embedding
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Retrieved documents, most similar first
+        """
+        # top_k is passed per call; concurrent queries must not share retriever state
+        return self.retriever.run(query_embedding=query_embedding, top_k=top_k)['documents']
+    
+    def _store(self, cache_key: str, query_embedding: np.ndarray, top_k: int,
+               documents: List[Document], result: Dict[str, Any]):
+        """
+        Cache a generated answer for exact repeats and similar questions.
+        
+        Only answers generated by Gemini from retrieved documents are cached.
+        
+        Args:
+            cache_key: Exact cache key from _lookup_exact
+            query_embedding: Question embedding
+            top_k: Number of documents retrieved
+            documents: Documents the answer was generated from
+            result: Response dictionary
+        """
+        if self.model and result['documents']:
+            self.exact_cache.put(cache_key, result)
+            self.semantic_cache.put(query_embedding, top_k, [doc.id for doc in documents], result)
     
     def query(self, question: str, top_k: int = 5) -> Dict[str, Any]:
         """
@@ -107,65 +292,248 @@ Yanıt:"""
             top_k: Number of documents to retrieve
             
         Returns:
-            Dictionary containing answer and retrieved documents
+            Dictionary containing answer and retrieved documents (a list of
+            dicts, whether or not the answer came from a cache)
         """
         try:
-            # Update retriever top_k if different
-            if self.retriever.top_k != top_k:
-                self.retriever.top_k = top_k
-            
-            # Run the pipeline to get documents
-            result = self.pipeline.run({
-                "text_embedder": {"text": question},
-                "prompt_builder": {"query": question}
-            })
-            
-            # Extract retrieved documents
-            documents = result.get('retriever', {}).get('documents', [])
-            
-            # Format retrieved documents
-            retrieved_docs = []
-            for doc in documents:
-                retrieved_docs.append({
-                    'content': doc.content,
-                    'title': doc.meta.get('title', 'Unknown'),
-                    'url': doc.meta.get('url', ''),
-                    'score': getattr(doc, 'score', 0.0)
-                })
+            cache_key, cached = self._lookup_exact(question, top_k)
+            if cached is not None:
+                return cached
+            
+            # Embed once: the embedding keys the semantic cache and drives retrieval
+            query_embedding = self._embed_question(question)
+            documents = self._retrieve(query_embedding, top_k)
+            cached = self._lookup_semantic(query_embedding, documents, question, top_k)
+            if cached is not None:
+                return cached
+            
+            retrieved_docs = list(map(_doc_to_dict, documents))
             
             # Generate answer using Gemini (if available)
             if self.model:
-                context_text = "\n\n".join([doc['content'] for doc in retrieved_docs])
-                prompt = f"""Sen Türkçe bir futbol asistanısın. Aşağıdaki bağlam bilgilerini kullanarak kullanıcının sorusunu Türkçe olarak yanıtla.
-
-Bağlam:
-{context_text}
-
-Soru: {question}
-
-Yanıt:"""
+                prompt = self._build_prompt(question, retrieved_docs)
                 
                 # Generate answer using Gemini
                 response = self.model.generate_content(prompt)
                 answer = response.text
             else:
                 # No API key - return retrieval info only
-                answer = f"API key bulunamadı. {len(retrieved_docs)} belge bulundu. API key ayarlayarak tam yanıt alabilirsiniz."
+                answer = _retrieval_only_answer(retrieved_docs)
             
+            result = {
+                'answer': answer,
+                'documents': retrieved_docs,
+                'query': question
+            }
+            self._store(cache_key, query_embedding, top_k, documents, result)
+            return result
+            
+        except Exception as e:
+            logger.exception("RAG pipeline query failed: %s", e)
             return {
+                'answer': f"Üzgünüm, sorunuzu yanıtlayamadım. Hata: {str(e)}",
+                'documents': [],
+                'query': question
+            }
+    
+    async def aquery(self, question: str, top_k: int = 5) -> Dict[str, Any]:
+        """
+        Query the RAG pipeline with a question without blocking the event loop.
+        
+        Embedding and retrieval run in worker threads and the Gemini call
+        uses the async API, so other coroutines run while they wait.
+        
+        Args:
+            question: User question in Turkish
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Dictionary containing answer and retrieved documents
+        """
+        try:
+            cache_key, cached = self._lookup_exact(question, top_k)
+            if cached is not None:
+                return cached
+            
+            query_embedding = await asyncio.to_thread(self._embed_question, question)
+            documents = await asyncio.to_thread(self._retrieve, query_embedding, top_k)
+            cached = self._lookup_semantic(query_embedding, documents, question, top_k)
+            if cached is not None:
+                return cached
+            
+            retrieved_docs = list(map(_doc_to_dict, documents))
+            
+            # Generate answer using Gemini (if available)
+            if self.model:
+                prompt = self._build_prompt(question, retrieved_docs)
+                response = await self.model.generate_content_async(prompt)
+                answer = response.text
+            else:
+                # No API key - return retrieval info only
+                answer = _retrieval_only_answer(retrieved_docs)
+            
+            result = {
                 'answer': answer,
                 'documents': retrieved_docs,
                 'query': question
             }
+            self._store(cache_key, query_embedding, top_k, documents, result)
+            return result
             
         except Exception as e:
-            print(f"Error in RAG pipeline query: {e}")
+            logger.exception("RAG pipeline async query failed: %s", e)
             return {
                 'answer': f"Üzgünüm, sorunuzu yanıtlayamadım. Hata: {str(e)}",
                 'documents': [],
                 'query': question
             }
     
+    async def abatch_query(self, questions: List[str], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Answer several questions concurrently.
+        
+        The Gemini calls overlap, so the batch takes about as long as its
+        slowest question.
+        
+        Args:
+            questions: User questions in Turkish
+            top_k: Number of documents to retrieve per question
+            
+        Returns:
+            Response dictionaries, in the order of the questions
+        """
+        return await asyncio.gather(*[self.aquery(question, top_k) for question in questions])
+    
+    def batch_query(self, questions: List[str], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Answer many questions at once with Gemini Batch Mode.
+        
+        Meant for offline workloads such as evaluations: questions are
+        embedded in one encode call and searched in one FAISS call, and
+        the prompts are submitted as a single batch job, which is cheaper
+        than individual requests but may take minutes or hours to finish.
+        Requires `pip install google-genai`.
+        
+        Args:
+            questions: User questions in Turkish
+            top_k: Number of documents to retrieve per question
+            
+        Returns:
+            Response dictionaries, in the order of the questions
+        """
+        if not questions:
+            return []
+        
+        if self.encoder is None:
+            self.warm_up()
+        
+        query_embeddings = self.encoder.encode(
+            questions,
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        retrieved = [list(map(_doc_to_dict, documents))
+                     for documents in self.retriever.search_batch(query_embeddings, top_k)]
+        
+        if self.model:
+            prompts = [self._build_prompt(question, docs) for question, docs in zip(questions, retrieved)]
+            answers = self._generate_batch(prompts)
+        else:
+            # No API key - return retrieval info only
+            answers = [_retrieval_only_answer(docs) for docs in retrieved]
+        
+        return [
+            {'answer': answer, 'documents': docs, 'query': question}
+            for question, docs, answer in zip(questions, retrieved, answers)
+        ]
+    
+    def _generate_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Generate answers for prompts with a Gemini batch job.
+        
+        Args:
+            prompts: Prompt texts
+            
+        Returns:
+            Answers, in the order of the prompts
+        """
+        from google import genai as genai_sdk
+        
+        client = genai_sdk.Client(api_key=self.api_key)
+        job = client.batches.create(
+            model=GEMINI_BATCH_MODEL,
+            src=[{'contents': [{'role': 'user', 'parts': [{'text': prompt}]}]} for prompt in prompts],
+            config={'display_name': 'superlig-rag-batch'}
+        )
+        logger.info("Submitted Gemini batch job %s with %d prompts", job.name, len(prompts))
+        
+        while job.state.name not in BATCH_DONE_STATES:
+            time.sleep(BATCH_POLL_INTERVAL)
+            job = client.batches.get(name=job.name)
+        
+        if job.state.name != 'JOB_STATE_SUCCEEDED':
+            raise RuntimeError(f"Gemini batch job {job.name} ended with {job.state.name}")
+        
+        answers = []
+        for response in job.dest.inlined_responses:
+            if response.response is not None:
+                answers.append(response.response.text)
+            else:
+                answers.append(f"Üzgünüm, yanıt oluşturamadım. Hata: {response.error}")
+        return answers
+    
+    def stream_query(self, question: str, top_k: int = 5) -> Iterator[Dict[str, Any]]:
+        """
+        Query the RAG pipeline, streaming the answer as it is generated.
+        
+        Args:
+            question: User question in Turkish
+            top_k: Number of documents to retrieve
+            
+        Yields:
+            First {'documents': [...]} with the retrieved documents, then
+            {'delta': text} for each generated piece of the answer; if the
+            query fails, a final {'error': text} with an apology instead
+        """
+        try:
+            cache_key, cached = self._lookup_exact(question, top_k)
+            if cached is None:
+                # Embed once: the embedding keys the semantic cache and drives retrieval
+                query_embedding = self._embed_question(question)
+                documents = self._retrieve(query_embedding, top_k)
+                cached = self._lookup_semantic(query_embedding, documents, question, top_k)
+            if cached is not None:
+                yield {'documents': cached['documents']}
+                yield {'delta': cached['answer']}
+                return
+            
+            retrieved_docs = list(map(_doc_to_dict, documents))
+            yield {'documents': retrieved_docs}
+            
+            # Stream answer from Gemini (if available)
+            if self.model:
+                prompt = self._build_prompt(question, retrieved_docs)
+                
+                answer = ""
+                for chunk in self.model.generate_content(prompt, stream=True):
+                    answer += chunk.text
+                    yield {'delta': chunk.text}
+                
+                self._store(cache_key, query_embedding, top_k, documents, {
+                    'answer': answer,
+                    'documents': retrieved_docs,
+                    'query': question
+                })
+            else:
+                # No API key - return retrieval info only
+                yield {'delta': _retrieval_only_answer(retrieved_docs)}
+            
+        except Exception as e:
+            logger.exception("RAG pipeline stream query failed: %s", e)
+            yield {'error': f"Üzgünüm, sorunuzu yanıtlayamadım. Hata: {str(e)}"}
+    
     def get_context_only(self, question: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Get only the retrieved context documents without generation.
@@ -178,29 +546,11 @@ Yanıt:"""
             List of retrieved document dictionaries
         """
         try:
-            # Update retriever top_k
-            self.retriever.top_k = top_k
-            
-            # Get documents from retriever
-            result = self.pipeline.run({
-                "text_embedder": {"text": question}
-            })
-            documents = result.get('retriever', {}).get('documents', [])
-            
-            # Format documents
-            retrieved_docs = []
-            for doc in documents:
-                retrieved_docs.append({
-                    'content': doc.content,
-                    'title': doc.meta.get('title', 'Unknown'),
-                    'url': doc.meta.get('url', ''),
-                    'score': getattr(doc, 'score', 0.0)
-                })
-            
-            return retrieved_docs
+            # Embed the question the same way as query
+            return list(map(_doc_to_dict, self._retrieve(self._embed_question(question), top_k)))
             
         except Exception as e:
-            print(f"Error retrieving documents: {e}")
+            logger.exception("Retrieving documents failed: %s", e)
             return []
     
     def generate_answer_with_context(self, question: str, context_docs: List[Dict[str, Any]]) -> str:
@@ -215,28 +565,18 @@ Yanıt:"""
             Generated answer
         """
         try:
-            # Prepare context text
-            context_text = "\n\n".join([doc['content'] for doc in context_docs])
-            
             # Create prompt
-            prompt = f"""Sen Türkçe bir futbol asistanısın. Aşağıdaki bağlam bilgilerini kullanarak kullanıcının sorusunu Türkçe olarak yanıtla.
-
-Bağlam:
-{context_text}
-
-Soru: {question}
-
-Yanıt:"""
+            prompt = self._build_prompt(question, context_docs)
             
             # Generate answer using Gemini (if available)
             if self.model:
                 response = self.model.generate_content(prompt)
                 return response.text
             else:
-                return f"API key bulunamadı. {len(context_docs)} belge bulundu. API key ayarlayarak tam yanıt alabilirsiniz."
+                return _retrieval_only_answer(context_docs)
             
         except Exception as e:
-            print(f"Error generating answer: {e}")
+            logger.exception("Generating answer failed: %s", e)
             return f"Üzgünüm, yanıt oluşturamadım. Hata: {str(e)}"
 
 
@@ -253,18 +593,23 @@ class RAGPipelineManager:
         """
         self.pipeline = TurkishRAGPipeline(document_store, api_key)
     
-    def ask_question(self, question: str, show_context: bool = False) -> Dict[str, Any]:
+    def warm_up(self):
+        """Warm up the underlying RAG pipeline."""
+        self.pipeline.warm_up()
+    
+    def ask_question(self, question: str, show_context: bool = False, top_k: int = 5) -> Dict[str, Any]:
         """
         Ask a question to the RAG pipeline.
         
         Args:
             question: User question
             show_context: Whether to include context documents in response
+            top_k: Number of documents to retrieve
             
         Returns:
             Response dictionary
         """
-        result = self.pipeline.query(question)
+        result = self.pipeline.query(question, top_k)
         
         if show_context:
             return result
@@ -274,6 +619,19 @@ class RAGPipelineManager:
                 'query': result['query']
             }
     
+    def ask_question_stream(self, question: str, top_k: int = 5) -> Iterator[Dict[str, Any]]:
+        """
+        Ask a question to the RAG pipeline, streaming the answer.
+        
+        Args:
+            question: User question
+            top_k: Number of documents to retrieve
+            
+        Yields:
+            Context documents first, then answer deltas
+        """
+        return self.pipeline.stream_query(question, top_k)
+    
     def get_similar_documents(self, question: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Get similar documents for a question.
@@ -289,6 +647,8 @@ class RAGPipelineManager:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Test the RAG pipeline
     from data_loader import SuperLigDataLoader, create_document_store
     
@@ -0,0 +1,239 @@
+"""
+In-memory answer caches for Turkish RAG Chatbot.
+Reuses generated answers for repeated questions and for questions that mean
+the same thing.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Union
+import faiss
+import numpy as np
+
+
+# Seconds an exact-match answer stays valid and maximum number of answers
+EXACT_CACHE_TTL = 300
+EXACT_CACHE_MAX_SIZE = 1024
+
+# Minimum cosine similarity between two questions to reuse an answer
+SEMANTIC_CACHE_THRESHOLD = 0.85
+# Seconds a cached answer stays valid
+SEMANTIC_CACHE_TTL = 300
+# Maximum number of cached answers; the least recently used is evicted
+SEMANTIC_CACHE_MAX_SIZE = 1024
+# Number of nearest cached questions checked per lookup
+SEMANTIC_CACHE_SEARCH_K = 8
+
+
+def _as_query_matrix(embedding: Union[List[float], np.ndarray]) -> np.ndarray:
+    """
+    Convert an embedding to an L2-normalized (1, dim) float32 matrix.
+    
+    Args:
+        embedding: Question embedding
+        
+    Returns:
+        Normalized matrix with a single row
+    """
+    matrix = np.array([embedding], dtype=np.float32)
+    faiss.normalize_L2(matrix)
+    return matrix
+
+
+def _freeze(response: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Make a response read-only so it can be shared by every cache hit.
+    
+    The documents list becomes a tuple of read-only mappings and the response
+    itself a read-only mapping; the content strings are shared, not copied.
+    Frozen responses can't be pickled or JSON-encoded, so the pipeline turns
+    them back into plain dicts before returning them.
+    
+    Args:
+        response: Response dictionary
+        
+    Returns:
+        Read-only view of the response
+    """
+    frozen = dict(response)
+    if 'documents' in frozen:
+        frozen['documents'] = tuple(MappingProxyType(dict(doc)) for doc in frozen['documents'])
+    return MappingProxyType(frozen)
+
+
+class ExactCache:
+    """LRU + TTL cache of answers keyed by the normalized question text."""
+    
+    def __init__(self, ttl: float = EXACT_CACHE_TTL, max_size: int = EXACT_CACHE_MAX_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds a cached answer stays valid
+            max_size: Maximum number of cached answers
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        
+        # Key -> (response, timestamp), least recently used first
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(question: str, top_k: int) -> str:
+        """
+        Compute the cache key of a question.
+        
+        Args:
+            question: User question
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Hex digest of the normalized question and top_k
+        """
+        return hashlib.sha256(f"{question.strip().lower()}|{top_k}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Mapping[str, Any]]:
+        """
+        Find the cached answer for a key.
+        
+        Args:
+            key: Cache key from ExactCache.key
+            
+        Returns:
+            Read-only cached response, or None on cache miss
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            
+            response, timestamp = entry
+            if time.monotonic() - timestamp >= self.ttl:
+                del self.entries[key]
+                return None
+            
+            self.entries.move_to_end(key)
+            return response
+    
+    def put(self, key: str, response: Dict[str, Any]):
+        """
+        Cache an answer.
+        
+        Args:
+            key: Cache key from ExactCache.key
+            response: Response dictionary to cache
+        """
+        with self._lock:
+            self.entries[key] = (_freeze(response), time.monotonic())
+            self.entries.move_to_end(key)
+            
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+
+class SemanticCache:
+    """
+    LRU + TTL cache of answers keyed by question embeddings (cosine similarity).
+    
+    The similarity threshold has not been validated for the embedding
+    model, so a hit also requires the same retrieved documents.
+    """
+    
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD, ttl: float = SEMANTIC_CACHE_TTL,
+                 max_size: int = SEMANTIC_CACHE_MAX_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: Seconds a cached answer stays valid
+            max_size: Maximum number of cached answers
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        
+        # Created on the first put, once the embedding dimension is known
+        self.index = None
+        # Entry id -> (top_k, doc_ids, response, timestamp), least recently used first
+        self.entries = OrderedDict()
+        self._next_id = 0
+        # The pipeline is shared by all Streamlit sessions
+        self._lock = threading.Lock()
+    
+    def get(self, embedding: Union[List[float], np.ndarray], top_k: int,
+            doc_ids: Sequence[str]) -> Optional[Mapping[str, Any]]:
+        """
+        Find the cached answer of a similar question.
+        
+        Args:
+            embedding: Question embedding
+            top_k: Number of documents the answer must have been retrieved with
+            doc_ids: Ids of the documents retrieved for the question, in order;
+                the answer must have been generated from the same documents
+            
+        Returns:
+            Read-only cached response, or None on cache miss
+        """
+        with self._lock:
+            if not self.entries:
+                return None
+            
+            k = min(SEMANTIC_CACHE_SEARCH_K, len(self.entries))
+            scores, ids = self.index.search(_as_query_matrix(embedding), k)
+            now = time.monotonic()
+            
+            # Results are ordered by similarity, so stop at the first one below the threshold
+            for score, entry_id in zip(scores[0], ids[0]):
+                if entry_id < 0 or score < self.threshold:
+                    break
+                
+                entry_id = int(entry_id)
+                entry_top_k, entry_doc_ids, response, timestamp = self.entries[entry_id]
+                if now - timestamp >= self.ttl:
+                    self._remove(entry_id)
+                    continue
+                
+                if entry_top_k == top_k and entry_doc_ids == tuple(doc_ids):
+                    self.entries.move_to_end(entry_id)
+                    return response
+            
+            return None
+    
+    def put(self, embedding: Union[List[float], np.ndarray], top_k: int, doc_ids: Sequence[str],
+            response: Dict[str, Any]):
+        """
+        Cache the answer to a question.
+        
+        Args:
+            embedding: Question embedding
+            top_k: Number of documents the answer was retrieved with
+            doc_ids: Ids of the documents the answer was generated from, in order
+            response: Response dictionary to cache
+        """
+        with self._lock:
+            matrix = _as_query_matrix(embedding)
+            if self.index is None:
+                self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(matrix.shape[1]))
+            
+            entry_id = self._next_id
+            self._next_id += 1
+            self.index.add_with_ids(matrix, np.array([entry_id], dtype=np.int64))
+            self.entries[entry_id] = (top_k, tuple(doc_ids), _freeze(response), time.monotonic())
+            
+            while len(self.entries) > self.max_size:
+                self._remove(next(iter(self.entries)))
+    
+    def _remove(self, entry_id: int):
+        """
+        Remove an entry from the index and the entries.
+        
+        Args:
+            entry_id: Id of the entry to remove
+        """
+        self.index.remove_ids(np.array([entry_id], dtype=np.int64))
+        del self.entries[entry_id]
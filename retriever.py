@@ -0,0 +1,276 @@
+"""
+Embedding retriever for Turkish RAG Chatbot.
+Keeps all document embeddings in one contiguous FP16 matrix (a FAISS scalar
+quantizer index) scored by inner product; larger corpora use a FAISS HNSW
+graph and very large ones FAISS IVF-PQ.
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import replace
+from typing import List, Dict, Any, Optional
+import faiss
+import numpy as np
+from haystack import Document, component
+from haystack.document_stores.in_memory import InMemoryDocumentStore
+
+
+logger = logging.getLogger(__name__)
+
+
+# Corpora with at least this many documents are searched with an HNSW graph
+HNSW_MIN_DOCUMENTS = 5000
+# Neighbors per HNSW node and candidate list size while building / searching
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+
+# Corpora with at least this many documents are searched with IVF-PQ, whose
+# compressed codes need far less memory than HNSW's full-precision vectors
+IVF_PQ_MIN_DOCUMENTS = 100000
+# Minimum number of IVF clusters and number of clusters probed per query
+IVF_NLIST = 64
+IVF_NPROBE = 16
+# Maximum number of PQ sub-quantizers and bits per sub-quantizer code
+PQ_MAX_SUBQUANTIZERS = 16
+PQ_NBITS = 8
+
+# Smaller corpora store embeddings at half precision and are scanned exhaustively
+SCALAR_QUANTIZER_TYPE = faiss.ScalarQuantizer.QT_fp16
+
+# Directory for persisted FAISS indexes
+INDEX_CACHE_DIR = os.path.join(".", ".cache")
+# Number of persisted indexes of each type kept on disk; older ones are deleted
+INDEX_CACHE_KEEP = 2
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a matrix in place.
+    
+    Args:
+        matrix: 2D float32 array
+        
+    Returns:
+        The normalized matrix
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _build_hnsw_index(embeddings: np.ndarray) -> faiss.Index:
+    """
+    Build an HNSW inner product index over normalized embeddings.
+    
+    Args:
+        embeddings: L2-normalized float32 matrix of shape (N, dim)
+        
+    Returns:
+        Populated FAISS index
+    """
+    index = faiss.IndexHNSWFlat(embeddings.shape[1], HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    index.add(embeddings)
+    return index
+
+
+def _build_ivfpq_index(embeddings: np.ndarray) -> faiss.Index:
+    """
+    Build an IVF-PQ inner product index over normalized embeddings.
+    
+    Args:
+        embeddings: L2-normalized float32 matrix of shape (N, dim)
+        
+    Returns:
+        Trained and populated FAISS index
+    """
+    n, dim = embeddings.shape
+    nlist = max(IVF_NLIST, int(np.sqrt(n)))
+    # The number of sub-quantizers must divide the embedding dimension
+    m = next(m for m in range(min(PQ_MAX_SUBQUANTIZERS, dim), 0, -1) if dim % m == 0)
+    
+    quantizer = faiss.IndexFlatIP(dim)
+    index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, PQ_NBITS, faiss.METRIC_INNER_PRODUCT)
+    index.train(embeddings)
+    index.add(embeddings)
+    return index
+
+
+def _build_fp16_index(embeddings: np.ndarray) -> faiss.Index:
+    """
+    Build an exhaustive FP16 inner product index over normalized embeddings.
+    
+    Halves the memory read per query compared to the float32 matrix; FAISS
+    widens the stored values to float32 while scoring.
+    
+    Args:
+        embeddings: L2-normalized float32 matrix of shape (N, dim)
+        
+    Returns:
+        Populated FAISS index
+    """
+    index = faiss.IndexScalarQuantizer(embeddings.shape[1], SCALAR_QUANTIZER_TYPE, faiss.METRIC_INNER_PRODUCT)
+    index.add(embeddings)
+    return index
+
+
+# Builders of the persisted index types
+_INDEX_BUILDERS = {
+    "hnsw": _build_hnsw_index,
+    "ivfpq": _build_ivfpq_index,
+}
+
+
+@component
+class MatrixEmbeddingRetriever:
+    """Retriever scoring documents by cosine similarity against an embedding matrix."""
+    
+    def __init__(self, document_store: InMemoryDocumentStore, top_k: int = 10,
+                 index_cache_dir: str = INDEX_CACHE_DIR):
+        """
+        Initialize the retriever.
+        
+        Embeddings are copied out of the document store once, so documents
+        written to the store afterwards are not retrievable. They are kept
+        at FP16 and scanned exhaustively. Corpora of at least
+        HNSW_MIN_DOCUMENTS documents are indexed with FAISS HNSW instead, and
+        those of at least IVF_PQ_MIN_DOCUMENTS with FAISS IVF-PQ; these
+        indexes are persisted and reused for the same documents and
+        embeddings.
+        
+        Args:
+            document_store: Document store with embedded documents
+            top_k: Default number of documents to retrieve
+            index_cache_dir: Directory for persisted FAISS indexes
+        """
+        self.document_store = document_store
+        self.top_k = top_k
+        
+        documents = [doc for doc in document_store.filter_documents() if doc.embedding is not None]
+        
+        # Parallel arrays: documents[i] (without embedding) is row i of the index
+        self.documents = [replace(doc, embedding=None) for doc in documents]
+        
+        self.index = None
+        if documents:
+            embeddings = _normalize_rows(np.array([doc.embedding for doc in documents], dtype=np.float32))
+            if len(documents) >= IVF_PQ_MIN_DOCUMENTS:
+                self.index = self._load_or_build_index(documents, embeddings, index_cache_dir, "ivfpq")
+                faiss.extract_index_ivf(self.index).nprobe = IVF_NPROBE
+            elif len(documents) >= HNSW_MIN_DOCUMENTS:
+                self.index = self._load_or_build_index(documents, embeddings, index_cache_dir, "hnsw")
+                self.index.hnsw.efSearch = HNSW_EF_SEARCH
+            else:
+                self.index = _build_fp16_index(embeddings)
+    
+    def _load_or_build_index(self, documents: List[Document], embeddings: np.ndarray,
+                             index_cache_dir: str, kind: str) -> faiss.Index:
+        """
+        Load the index for these documents from disk, or build it.
+        
+        The index file is keyed by the document ids and the embeddings:
+        ids only depend on content and meta, so re-embedding the same
+        corpus with another model or backend must not reload the old index.
+        
+        Args:
+            documents: Embedded documents, in index order
+            embeddings: L2-normalized embeddings of the documents
+            index_cache_dir: Directory for persisted FAISS indexes
+            kind: Index type, "ivfpq" or "hnsw"
+            
+        Returns:
+            FAISS index
+        """
+        hasher = hashlib.sha256()
+        for doc in documents:
+            hasher.update(doc.id.encode("utf-8"))
+        hasher.update(embeddings.tobytes())
+        index_path = os.path.join(index_cache_dir, f"faiss_{kind}_{hasher.hexdigest()}.index")
+        
+        index = None
+        if os.path.exists(index_path):
+            try:
+                index = faiss.read_index(index_path)
+                logger.info("Loaded FAISS index from %s", index_path)
+            except Exception as e:
+                logger.warning("Could not read FAISS index %s: %s", index_path, e)
+        
+        if index is None:
+            logger.info("Building FAISS %s index for %d documents...", kind, len(documents))
+            index = _INDEX_BUILDERS[kind](embeddings)
+            try:
+                os.makedirs(index_cache_dir, exist_ok=True)
+                faiss.write_index(index, index_path)
+            except Exception as e:
+                logger.warning("Could not write FAISS index %s: %s", index_path, e)
+            else:
+                self._remove_old_indexes(index_cache_dir, kind)
+        
+        return index
+    
+    @staticmethod
+    def _remove_old_indexes(index_cache_dir: str, kind: str):
+        """
+        Delete all but the INDEX_CACHE_KEEP most recently written indexes of a type.
+        
+        Every corpus or embedding change writes a new index file, so without
+        this the cache directory grows without bound.
+        
+        Args:
+            index_cache_dir: Directory for persisted FAISS indexes
+            kind: Index type, "ivfpq" or "hnsw"
+        """
+        prefix = f"faiss_{kind}_"
+        saved = [os.path.join(index_cache_dir, name) for name in os.listdir(index_cache_dir)
+                 if name.startswith(prefix) and name.endswith(".index")]
+        saved.sort(key=os.path.getmtime, reverse=True)
+        for path in saved[INDEX_CACHE_KEEP:]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Could not remove old FAISS index %s: %s", path, e)
+    
+    @component.output_types(documents=List[Document])
+    def run(self, query_embedding: List[float], top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Retrieve the documents most similar to a query embedding.
+        
+        Args:
+            query_embedding: Embedding of the query
+            top_k: Number of documents to retrieve (defaults to self.top_k)
+            
+        Returns:
+            Dictionary with the retrieved documents, most similar first
+        """
+        return {"documents": self.search_batch([query_embedding], top_k)[0]}
+    
+    def search_batch(self, query_embeddings: List[List[float]], top_k: Optional[int] = None) -> List[List[Document]]:
+        """
+        Retrieve the documents most similar to each of several query embeddings.
+        
+        All queries are searched with a single FAISS call.
+        
+        Args:
+            query_embeddings: Embeddings of the queries
+            top_k: Number of documents to retrieve per query (defaults to self.top_k)
+            
+        Returns:
+            List of retrieved documents per query, most similar first
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not self.documents or top_k <= 0:
+            return [[] for _ in query_embeddings]
+        
+        queries = _normalize_rows(np.array(query_embeddings, dtype=np.float32))
+        k = min(top_k, len(self.documents))
+        
+        scores, ids = self.index.search(queries, k)
+        # FAISS pads with -1 when fewer than k results are found
+        return [
+            [replace(self.documents[i], score=float(s)) for i, s in zip(row_ids, row_scores) if i >= 0]
+            for row_ids, row_scores in zip(ids, scores)
+        ]